@@ -4,16 +4,27 @@ A FastAPI application for mood tracking with video vlogs.
 """
 
 import os
-from typing import Optional, List, Dict, Any
+import re
+import asyncio
+import hashlib
+from datetime import date
+from typing import Annotated, Optional, List, Dict, Any, Tuple
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field, validator
-from motor.motor_asyncio import AsyncIOMotorClient
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, Field, StringConstraints
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
 from bson import ObjectId
+from bson.codec_options import CodecOptions, TypeDecoder, TypeRegistry
+from bson.errors import InvalidId
+from pymongo.errors import BulkWriteError, WriteError
+import brotli
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 import logging
 
@@ -26,27 +37,149 @@ load_dotenv()
 
 # Constants
 VIDEOS_DIR = "videos"
+# Read at import, so resolved next to this file rather than the working directory
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STATIC_URL = "/static"
+DASHBOARD_FILE = os.path.join(STATIC_DIR, "dashboard.html")
+DASHBOARD_ASSETS = ("dashboard.css", "dashboard.js")
 MONGO_URL = os.getenv("MONGODB_URL")
 DB_NAME = "emogo_db"
 COLLECTION_NAME = "records"
 
+# Connection pool sized for bursts; compression cuts bytes for large /records reads.
+# TCP keepalive is always on in PyMongo 4 (socketKeepAlive was removed).
+MONGO_CLIENT_OPTIONS = {
+    "maxPoolSize": 200,
+    "minPoolSize": 20,
+    "serverSelectionTimeoutMS": 3000,
+    "connectTimeoutMS": 2000,
+    "waitQueueTimeoutMS": 1000,
+    "compressors": "zstd,zlib",
+}
+
+# Browser origins allowed by CORS; compiled at import so a bad pattern fails fast
+CORS_ORIGIN_RE = re.compile(os.getenv(
+    "CORS_ORIGINS_RE",
+    r"^https://emogo-backend-chaudharyinder\.onrender\.com$|^https?://(localhost|127\.0\.0\.1)(:\d+)?$"
+))
+
+# Stored record fields; find() projects to these so extra keys never ship
+RECORD_FIELDS = ("mood", "latitude", "longitude", "timestamp", "vlog_file", "note")
+RECORD_PROJECTION = {field: 1 for field in RECORD_FIELDS}
+
+# Largest batch accepted by POST /records/bulk
+MAX_BULK_RECORDS = 1000
+
+# Seconds browsers may reuse the dashboard page without revalidating
+DASHBOARD_MAX_AGE = 60
+
+# Seconds browsers may keep a content-versioned static asset (?v=<hash>)
+ASSET_MAX_AGE = 31536000
+
+# Seconds a cached /records response may be served before re-querying
+RECORDS_CACHE_TTL = 30
+
+# Byte budget for cached response bodies, and the largest single body kept;
+# unbounded ?limit=0 listings would otherwise pin copies of the collection
+RECORDS_CACHE_BYTES = 16 * 1024 * 1024
+RECORDS_CACHE_MAX_BODY = 1024 * 1024
+
+# Newest-first listing order; _id breaks timestamp ties so skip-based pages
+# never repeat or drop records that share a timestamp
+RECORD_SORT = [("timestamp", -1), ("_id", -1)]
+
+# Compound index behind ?mood= listings; projections limited to its keys
+# (without _id) are answered from the index alone
+MOOD_TIMESTAMP_INDEX = [("mood", 1), ("timestamp", -1), ("_id", -1)]
+MOOD_TIMESTAMP_FIELDS = {"mood", "timestamp"}
+
+# Listing indexes from before _id was added to the sort; dropped at startup
+# so inserts do not keep maintaining them
+SUPERSEDED_INDEXES = ("timestamp_-1", "mood_1_timestamp_-1")
+
+# Most queued POST /record documents written by one insert_many
+INSERT_BATCH_SIZE = 500
+
+# Records that may wait for the flusher; past this, POST /record waits to enqueue
+INSERT_QUEUE_SIZE = 10 * INSERT_BATCH_SIZE
+
+# Upper bound on documents fetched per cursor round-trip
+MAX_BATCH_SIZE = 500
+
+# Records removed per delete_many by /records/cleanup
+CLEANUP_BATCH_SIZE = 1000
+
+# Records whose video file is missing or empty (built once, reused per cleanup).
+# Matching None also matches documents without the field, so one $in covers all
+# three cases with a single range scan on the vlog_file index.
+EMPTY_VLOG_FILTER = {"vlog_file": {"$in": [None, ""]}}
+
+class ObjectIdAsStr(TypeDecoder):
+    """Decode BSON ObjectIds straight to their hex string"""
+    bson_type = ObjectId
+    
+    def transform_bson(self, value: ObjectId) -> str:
+        return str(value)
+
+# Read records with _id already a str, converted during BSON decoding rather
+# than by a Python pass over every document afterwards
+RECORD_CODEC_OPTIONS = CodecOptions(type_registry=TypeRegistry([ObjectIdAsStr()]))
+
+# Bound once in lifespan so handlers skip the app attribute lookups per call
+records_collection: Optional[AsyncIOMotorCollection] = None
+
+# Set once MOOD_TIMESTAMP_INDEX exists; until then queries are not hinted to it
+mood_index_ready = False
+
+# POST /record hands (document, future) pairs to the insert flusher task
+insert_queue: Optional[asyncio.Queue] = None
+
+# A record's timestamp parsed to a date (offsets applied); unparseable ones map to null
+TIMESTAMP_DATE_EXPR = {"$dateFromString": {"dateString": "$timestamp", "onError": None, "onNull": None}}
+
+# UTC calendar day of a record's timestamp, or null if it does not parse
+TIMESTAMP_DAY_EXPR = {"$dateToString": {"format": "%Y-%m-%d", "date": TIMESTAMP_DATE_EXPR}}
+
 # ==================== LIFESPAN CONTEXT ====================
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage database connection lifecycle"""
+    global records_collection, insert_queue
     # Startup
     if not MONGO_URL:
         logger.error("MONGODB_URL environment variable is not set!")
         raise RuntimeError("MONGODB_URL is required")
     
-    app.mongodb_client = AsyncIOMotorClient(MONGO_URL)
+    app.mongodb_client = AsyncIOMotorClient(MONGO_URL, **MONGO_CLIENT_OPTIONS)
     app.database = app.mongodb_client[DB_NAME]
-    app.collection = app.database[COLLECTION_NAME]
-    logger.info("Connected to MongoDB")
+    app.collection = records_collection = app.database.get_collection(
+        COLLECTION_NAME, codec_options=RECORD_CODEC_OPTIONS
+    )
+    
+    # Pay the TLS/auth handshake now rather than inside the first request
+    try:
+        await app.mongodb_client.admin.command("ping")
+        logger.info("Connected to MongoDB")
+    except Exception as e:
+        logger.error(f"MongoDB ping failed at startup: {e}")
+    await ensure_indexes(records_collection)
+    
+    insert_queue = asyncio.Queue(maxsize=INSERT_QUEUE_SIZE)
+    flusher = asyncio.create_task(flush_inserts(insert_queue))
     
     yield
     
     # Shutdown
+    flusher.cancel()
+    try:
+        await flusher
+    except asyncio.CancelledError:
+        pass
+    # Records the flusher never picked up would leave their POSTs waiting forever
+    while not insert_queue.empty():
+        _, future = insert_queue.get_nowait()
+        if not future.done():
+            future.set_exception(RuntimeError("Server shutting down before record was written"))
     app.mongodb_client.close()
     logger.info("Closed MongoDB connection")
 
@@ -61,15 +194,36 @@ app = FastAPI(
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origin_regex=CORS_ORIGIN_RE.pattern,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress JSON/HTML responses over 1KB; responses that already carry a
+# Content-Encoding (the brotli dashboard) and video files pass through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+class VersionedStaticFiles(StaticFiles):
+    """Static files that are cached for a year when requested with ?v=<hash>"""
+    
+    def file_response(
+        self,
+        full_path: str,
+        stat_result: os.stat_result,
+        scope: Dict[str, Any],
+        status_code: int = 200
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        # The hash changes with the content, so a versioned URL never goes stale
+        if Request(scope).query_params.get("v"):
+            response.headers["Cache-Control"] = f"public, max-age={ASSET_MAX_AGE}, immutable"
+        return response
+
 # Ensure videos directory exists and mount static files
 os.makedirs(VIDEOS_DIR, exist_ok=True)
 app.mount(f"/{VIDEOS_DIR}", StaticFiles(directory=VIDEOS_DIR), name="videos")
+app.mount(STATIC_URL, VersionedStaticFiles(directory=STATIC_DIR), name="static")
 
 # ==================== PYDANTIC MODELS ====================
 class EmoRecord(BaseModel):
@@ -77,17 +231,13 @@ class EmoRecord(BaseModel):
     mood: str = Field(..., min_length=1, max_length=50, description="User's mood")
     latitude: float = Field(..., ge=-90, le=90, description="Latitude coordinate")
     longitude: float = Field(..., ge=-180, le=180, description="Longitude coordinate")
-    timestamp: str = Field(..., description="ISO format timestamp")
+    # Stripped and checked for emptiness inside pydantic-core, no Python validator
+    timestamp: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)] = Field(
+        ..., description="ISO format timestamp"
+    )
     vlog_file: Optional[str] = Field(default="demo_vlog.mp4", description="Video filename or URL")
     note: Optional[str] = Field(default=None, max_length=500, description="Optional note")
 
-    @validator('timestamp')
-    def validate_timestamp(cls, v):
-        """Ensure timestamp is not empty"""
-        if not v or not v.strip():
-            raise ValueError("Timestamp cannot be empty")
-        return v.strip()
-
     class Config:
         json_schema_extra = {
             "example": {
@@ -107,16 +257,184 @@ class RecordResponse(BaseModel):
     deleted: Optional[str] = None
     deleted_count: Optional[int] = None
 
+class BulkRecordResponse(BaseModel):
+    """Response model for bulk record creation"""
+    status: str
+    ids: List[str]
+
 # ==================== HELPER FUNCTIONS ====================
-def serialize_doc(doc: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert MongoDB document to JSON-serializable dict"""
-    if doc and "_id" in doc:
-        doc["_id"] = str(doc["_id"])
-    return doc
+# Per-process cache of encoded /records and /records/stats JSON bodies,
+# cleared on every write; sized by body length in bytes
+records_cache: TTLCache = TTLCache(maxsize=RECORDS_CACHE_BYTES, ttl=RECORDS_CACHE_TTL, getsizeof=len)
+
+# Bumped by every write, so a read that started before the write never
+# caches its pre-write body after the clear
+cache_generation = 0
+
+def invalidate_records_cache() -> None:
+    """Drop cached bodies after a write and fence off in-flight reads"""
+    global cache_generation
+    cache_generation += 1
+    records_cache.clear()
+
+def store_cached_body(key: Tuple, body: bytes, generation: int) -> None:
+    """Cache a body unless a write finished since `generation` was read, or it is too large"""
+    if generation == cache_generation and len(body) <= RECORDS_CACHE_MAX_BODY:
+        records_cache[key] = body
+
+async def ensure_indexes(collection) -> None:
+    """Create the indexes used by list and cleanup queries (idempotent)"""
+    global mood_index_ready
+    try:
+        # Newest-first listing, with and without a mood filter
+        await collection.create_index(RECORD_SORT)
+        await collection.create_index(MOOD_TIMESTAMP_INDEX)
+        mood_index_ready = True
+        # Not sparse: a sparse index cannot answer the null/missing match in cleanup
+        await collection.create_index([("vlog_file", 1)])
+        existing = await collection.index_information()
+        for name in SUPERSEDED_INDEXES:
+            if name in existing:
+                await collection.drop_index(name)
+                logger.info(f"Dropped superseded index {name}")
+        logger.info("MongoDB indexes ensured")
+    except Exception as e:
+        logger.error(f"Error creating indexes: {e}")
+
+async def flush_inserts(queue: asyncio.Queue) -> None:
+    """
+    Write queued records in batches and resolve each caller's future
+    
+    Waits for the first queued record, then takes whatever else is already
+    waiting (up to INSERT_BATCH_SIZE) so a burst of POSTs becomes one
+    insert_many, while a lone POST is written immediately.
+    """
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < INSERT_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        
+        failed: Dict[int, Dict[str, Any]] = {}
+        try:
+            await records_collection.insert_many([doc for doc, _ in batch], ordered=False)
+        except BulkWriteError as e:
+            failed = {err["index"]: err for err in e.details.get("writeErrors", [])}
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+        
+        # insert_many sets _id on every document it was given
+        for index, (doc, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in failed:
+                err = failed[index]
+                future.set_exception(WriteError(err.get("errmsg"), err.get("code"), err))
+            else:
+                future.set_result(doc["_id"])
+
+def json_response(content: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Encode plain JSON data with orjson, skipping FastAPI's jsonable_encoder"""
+    return json_body_response(orjson.dumps(content), headers=headers)
+
+def json_body_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Send an already-encoded JSON body, e.g. one held in records_cache"""
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def parse_object_id(record_id: str) -> ObjectId:
+    """Parse a record ID once, raising 400 if it is not a valid ObjectId"""
+    try:
+        return ObjectId(record_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid record ID format"
+        )
+
+def record_to_doc(record: EmoRecord) -> Dict[str, Any]:
+    """Build the MongoDB document for a validated record"""
+    # No aliases or custom serializers on EmoRecord, so a shallow copy of the
+    # field values matches model_dump() without walking the serializer. Copy
+    # because the driver adds _id to the dict it inserts.
+    return dict(record.__dict__)
+
+def build_projection(fields: Optional[str]) -> Dict[str, int]:
+    """Build a Mongo projection from a comma-separated list of field names"""
+    requested = {name.strip() for name in (fields or "").split(",") if name.strip()}
+    # Blank lists like "fields=," fall back too: {"_id": 0} alone returns every stored key
+    if not requested:
+        return RECORD_PROJECTION
+
+    unknown = requested - set(RECORD_FIELDS) - {"_id"}
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+
+    projection = {name: 1 for name in requested}
+    if "_id" not in requested:
+        projection["_id"] = 0
+    return projection
+
+def parse_day(value: str, name: str) -> date:
+    """Parse a YYYY-MM-DD query parameter, raising 400 if it is malformed"""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{name} must be a YYYY-MM-DD date"
+        )
+
+def build_record_filter(
+    mood: Optional[str] = None,
+    q: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the Mongo filter for the dashboard's mood, note and date controls
+    
+    Date bounds compare each record's parsed UTC day, the same value
+    /records/stats buckets by day, so the table, totals and timeline agree.
+    Both bounds are inclusive; unparseable timestamps never match a range.
+    """
+    query: Dict[str, Any] = {}
+    if mood:
+        query["mood"] = mood
+    if q:
+        query["note"] = {"$regex": re.escape(q), "$options": "i"}
+    if date_from or date_to:
+        # A null day sorts below every string, so $gte "" alone drops unparseable ones
+        lower = parse_day(date_from, "date_from").isoformat() if date_from else ""
+        bounds = [{"$gte": [TIMESTAMP_DAY_EXPR, lower]}]
+        if date_to:
+            bounds.append({"$lte": [TIMESTAMP_DAY_EXPR, parse_day(date_to, "date_to").isoformat()]})
+        query["$expr"] = {"$and": bounds}
+    return query
+
+def find_records(query: Dict[str, Any], projection: Dict[str, int], limit: int, skip: int):
+    """Build the newest-first records cursor shared by the list endpoints"""
+    cursor = records_collection.find(
+        query, projection, batch_size=min(limit, MAX_BATCH_SIZE) if limit > 0 else MAX_BATCH_SIZE
+    ).sort(RECORD_SORT).skip(skip).limit(limit)
+    
+    # e.g. ?mood=happy&fields=mood,timestamp becomes a covered index scan
+    if (mood_index_ready and "mood" in query and set(query) <= MOOD_TIMESTAMP_FIELDS
+            and projection.get("_id") == 0 and set(projection) - {"_id"} <= MOOD_TIMESTAMP_FIELDS):
+        cursor = cursor.hint(MOOD_TIMESTAMP_INDEX)
+    return cursor
 
 async def get_collection():
     """Dependency to get collection"""
-    return app.collection
+    return records_collection
 
 # ==================== API ROUTES ====================
 
@@ -147,9 +465,12 @@ async def add_record(record: EmoRecord):
     - **note**: Optional text note
     """
     try:
-        result = await app.collection.insert_one(record.model_dump())
-        logger.info(f"Created record with ID: {result.inserted_id}")
-        return RecordResponse(status="success", id=str(result.inserted_id))
+        future = asyncio.get_running_loop().create_future()
+        await insert_queue.put((record_to_doc(record), future))
+        inserted_id = await future
+        invalidate_records_cache()
+        logger.info(f"Created record with ID: {inserted_id}")
+        return RecordResponse(status="success", id=str(inserted_id))
     except Exception as e:
         logger.error(f"Error creating record: {e}")
         raise HTTPException(
@@ -157,11 +478,60 @@ async def add_record(record: EmoRecord):
             detail="Failed to create record"
         )
 
+@app.post(
+    "/records/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=BulkRecordResponse,
+    tags=["Records"]
+)
+async def add_records_bulk(
+    # Checked during list validation, which stops at the first record past the limit
+    records: Annotated[List[EmoRecord], Field(max_length=MAX_BULK_RECORDS)]
+):
+    """
+    Create many emotion records in one database round-trip
+    
+    Records are inserted unordered: if some fail, the rest are still
+    written and the response reports how many succeeded.
+    """
+    if not records:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No records provided"
+        )
+    
+    try:
+        result = await records_collection.insert_many(
+            [record_to_doc(record) for record in records], ordered=False
+        )
+    except BulkWriteError as e:
+        invalidate_records_cache()
+        inserted = e.details.get("nInserted", 0)
+        logger.error(f"Bulk insert partially failed ({inserted}/{len(records)}): {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Inserted {inserted} of {len(records)} records"
+        )
+    except Exception as e:
+        logger.error(f"Error creating records: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create records"
+        )
+    
+    invalidate_records_cache()
+    logger.info(f"Created {len(result.inserted_ids)} records in bulk")
+    return BulkRecordResponse(status="success", ids=[str(oid) for oid in result.inserted_ids])
+
 @app.get("/records", tags=["Records"])
 async def list_records(
     limit: int = 100,
     skip: int = 0,
-    mood: Optional[str] = None
+    mood: Optional[str] = None,
+    q: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    fields: Optional[str] = None
 ):
     """
     List all emotion records with optional filtering
@@ -169,16 +539,29 @@ async def list_records(
     - **limit**: Maximum number of records to return (default: 100)
     - **skip**: Number of records to skip (default: 0)
     - **mood**: Filter by specific mood (optional)
+    - **q**: Case-insensitive substring of the note (optional)
+    - **date_from** / **date_to**: Inclusive YYYY-MM-DD bounds (optional)
+    - **fields**: Comma-separated fields to return, e.g. `mood,timestamp` (optional)
     """
+    cache_key = (limit, skip, mood, q, date_from, date_to, fields)
+    cached = records_cache.get(cache_key)
+    if cached is not None:
+        return json_body_response(cached)
+
+    generation = cache_generation
+    query = build_record_filter(mood, q, date_from, date_to)
+    projection = build_projection(fields)
     try:
-        query = {"mood": mood} if mood else {}
-        cursor = app.collection.find(query).sort("timestamp", -1).skip(skip).limit(limit)
+        cursor = find_records(query, projection, limit, skip)
         
-        items = []
-        async for doc in cursor:
-            items.append(serialize_doc(doc))
-        
-        return {"records": items, "count": len(items)}
+        # Drain in driver-sized batches. Stored documents passed EmoRecord
+        # validation on insert, so they are returned as-is; if a typed object
+        # is ever needed, use EmoRecord.model_construct(**doc), not model_validate.
+        docs = await cursor.to_list(length=None)
+        # Cache the encoded body so hits skip serialization entirely
+        body = orjson.dumps({"records": docs, "count": len(docs)})
+        store_cached_body(cache_key, body, generation)
+        return json_body_response(body)
     except Exception as e:
         logger.error(f"Error fetching records: {e}")
         raise HTTPException(
@@ -186,23 +569,123 @@ async def list_records(
             detail="Failed to fetch records"
         )
 
-@app.get("/record/{record_id}", tags=["Records"])
-async def get_record(record_id: str):
-    """Get a single record by ID"""
-    if not ObjectId.is_valid(record_id):
+@app.get("/records.ndjson", tags=["Records"])
+async def stream_records(
+    limit: int = 100,
+    skip: int = 0,
+    mood: Optional[str] = None,
+    q: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """
+    Stream emotion records as newline-delimited JSON
+    
+    Takes the same parameters as `GET /records`, but writes each record as
+    soon as it is read so large exports start immediately and are never
+    held in memory as a whole.
+    """
+    query = build_record_filter(mood, q, date_from, date_to)
+    cursor = find_records(query, build_projection(fields), limit, skip)
+    
+    async def generate():
+        try:
+            async for doc in cursor:
+                yield orjson.dumps(doc) + b"\n"
+        except Exception as e:
+            logger.error(f"Error streaming records: {e}")
+            raise
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+@app.get("/records/stats", tags=["Records"])
+async def record_stats(
+    mood: Optional[str] = None,
+    q: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None
+):
+    """
+    Record totals, mood and per-day counts, aggregated in MongoDB
+    
+    - **mood**: Filter by specific mood (optional)
+    - **q**: Case-insensitive substring of the note (optional)
+    - **date_from** / **date_to**: Inclusive YYYY-MM-DD bounds (optional)
+    """
+    cache_key = ("stats", mood, q, date_from, date_to)
+    cached = records_cache.get(cache_key)
+    if cached is not None:
+        return json_body_response(cached)
+
+    generation = cache_generation
+    query = build_record_filter(mood, q, date_from, date_to)
+    try:
+        # One $facet pass: the filter is matched once and all groupings
+        # share the scan, instead of two separate aggregations
+        [result] = await records_collection.aggregate([
+            {"$match": query},
+            {"$facet": {
+                "moods": [
+                    {"$group": {"_id": "$mood", "count": {"$sum": 1}}},
+                    {"$sort": {"count": -1}}
+                ],
+                "by_day": [
+                    {"$group": {"_id": TIMESTAMP_DAY_EXPR, "count": {"$sum": 1}}},
+                    {"$sort": {"_id": 1}}
+                ],
+                "totals": [
+                    {"$group": {
+                        "_id": None,
+                        "total": {"$sum": 1},
+                        "with_video": {"$sum": {"$cond": [
+                            {"$ne": [{"$ifNull": ["$vlog_file", ""]}, ""]}, 1, 0
+                        ]}},
+                        # Compared as dates: raw strings would rank "now" above
+                        # any "2025-..." and ignore UTC offsets; nulls are skipped
+                        "latest": {"$max": TIMESTAMP_DATE_EXPR}
+                    }}
+                ]
+            }}
+        ]).to_list(length=1)
+        
+        totals = result["totals"][0] if result["totals"] else {}
+        latest = totals.get("latest")
+        response = {
+            "total": totals.get("total", 0),
+            "with_video": totals.get("with_video", 0),
+            # BSON dates decode as naive UTC datetimes
+            "latest": latest.isoformat(timespec="milliseconds") + "Z" if latest else None,
+            "mood_counts": {row["_id"]: row["count"] for row in result["moods"] if row["_id"]},
+            "by_day": {row["_id"]: row["count"] for row in result["by_day"] if row["_id"]}
+        }
+        body = orjson.dumps(response)
+        store_cached_body(cache_key, body, generation)
+        return json_body_response(body)
+    except Exception as e:
+        logger.error(f"Error aggregating records: {e}")
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid record ID format"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to aggregate records"
         )
+
+@app.get("/record/{record_id}", tags=["Records"])
+async def get_record(record_id: str, request: Request):
+    """Get a single record by ID"""
+    oid = parse_object_id(record_id)
+    # Records are never updated in place, so the ID alone identifies the content
+    etag = f'W/"{record_id}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
     
-    doc = await app.collection.find_one({"_id": ObjectId(record_id)})
+    doc = await records_collection.find_one({"_id": oid}, RECORD_PROJECTION)
     if not doc:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Record not found"
         )
     
-    return serialize_doc(doc)
+    return json_response(doc, headers={"ETag": etag})
 
 @app.delete(
     "/record/{record_id}",
@@ -211,19 +694,15 @@ async def get_record(record_id: str):
 )
 async def delete_record(record_id: str):
     """Delete a single record by ID"""
-    if not ObjectId.is_valid(record_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid record ID format"
-        )
-    
-    result = await app.collection.delete_one({"_id": ObjectId(record_id)})
+    oid = parse_object_id(record_id)
+    result = await records_collection.delete_one({"_id": oid})
     if result.deleted_count == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Record not found"
         )
     
+    invalidate_records_cache()
     logger.info(f"Deleted record: {record_id}")
     return RecordResponse(status="success", deleted=record_id)
 
@@ -233,669 +712,75 @@ async def delete_record(record_id: str):
     tags=["Maintenance"]
 )
 async def cleanup_empty_vlogs():
-    """Remove all records with missing or empty video files"""
-    query = {
-        "$or": [
-            {"vlog_file": {"$exists": False}},
-            {"vlog_file": None},
-            {"vlog_file": ""}
-        ]
-    }
+    """
+    Remove all records with missing or empty video files
     
-    result = await app.collection.delete_many(query)
-    logger.info(f"Cleaned up {result.deleted_count} records without videos")
-    return RecordResponse(status="success", deleted_count=result.deleted_count)
+    Deletes by _id in chunks of CLEANUP_BATCH_SIZE, so a large cleanup
+    never runs as one long write.
+    """
+    # Default codec: the _ids must stay ObjectIds to match in the $in below
+    ids_cursor = records_collection.with_options(codec_options=CodecOptions()).find(
+        EMPTY_VLOG_FILTER, {"_id": 1}, batch_size=CLEANUP_BATCH_SIZE
+    )
+    deleted_count = 0
+    batch: List[Any] = []
+    async for doc in ids_cursor:
+        batch.append(doc["_id"])
+        if len(batch) == CLEANUP_BATCH_SIZE:
+            result = await records_collection.delete_many({"_id": {"$in": batch}})
+            deleted_count += result.deleted_count
+            batch = []
+    if batch:
+        result = await records_collection.delete_many({"_id": {"$in": batch}})
+        deleted_count += result.deleted_count
+    
+    invalidate_records_cache()
+    logger.info(f"Cleaned up {deleted_count} records without videos")
+    return RecordResponse(status="success", deleted_count=deleted_count)
 
 # ==================== ADMIN DASHBOARD ====================
 
+def load_dashboard(path: str) -> Tuple[bytes, bytes, str]:
+    """
+    Read the dashboard page once as (plain, brotli-compressed, ETag)
+    
+    Links to DASHBOARD_ASSETS get a ?v=<content hash> suffix, so browsers
+    cache the CSS/JS for good and refetch them only after they change.
+    """
+    with open(path, "rb") as f:
+        html = f.read()
+    for name in DASHBOARD_ASSETS:
+        with open(os.path.join(STATIC_DIR, name), "rb") as f:
+            version = hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+        url = f"{STATIC_URL}/{name}"
+        html = html.replace(f'"{url}"'.encode(), f'"{url}?v={version}"'.encode())
+    # Weak: the same validator covers both the plain and the brotli encoding
+    etag = f'W/"{hashlib.blake2b(html, digest_size=8).hexdigest()}"'
+    return html, brotli.compress(html, quality=11), etag
+
+# The page is static, so it is read and compressed once at import
+DASHBOARD_HTML, DASHBOARD_BR, DASHBOARD_ETAG = load_dashboard(DASHBOARD_FILE)
+
+def accepts_brotli(request: Request) -> bool:
+    """Check whether the client lists br in its Accept-Encoding header"""
+    encodings = request.headers.get("accept-encoding", "").split(",")
+    return any(enc.split(";")[0].strip() == "br" for enc in encodings)
+
 @app.get("/export", response_class=HTMLResponse, tags=["Dashboard"])
 async def export_dashboard(request: Request):
     """Interactive admin dashboard with statistics and filtering"""
-    base_url = str(request.base_url).rstrip("/")
+    headers = {
+        "Cache-Control": f"public, max-age={DASHBOARD_MAX_AGE}",
+        "ETag": DASHBOARD_ETAG,
+        "Vary": "Accept-Encoding"
+    }
     
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>EmoGo Admin Dashboard</title>
-        <style>
-            :root {{
-                --bg-primary: #0f172a;
-                --bg-secondary: #1e293b;
-                --bg-card: rgba(30, 41, 59, 0.8);
-                --text-primary: #f1f5f9;
-                --text-secondary: #94a3b8;
-                --accent: #3b82f6;
-                --accent-hover: #2563eb;
-                --success: #10b981;
-                --success-hover: #059669;
-                --danger: #ef4444;
-                --danger-hover: #dc2626;
-                --border: #334155;
-            }}
-            
-            * {{
-                box-sizing: border-box;
-                margin: 0;
-                padding: 0;
-            }}
-            
-            body {{
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%);
-                color: var(--text-primary);
-                min-height: 100vh;
-                padding: 2rem;
-            }}
-            
-            .container {{
-                max-width: 1400px;
-                margin: 0 auto;
-            }}
-            
-            header {{
-                margin-bottom: 2rem;
-            }}
-            
-            h1 {{
-                font-size: 2rem;
-                font-weight: 700;
-                margin-bottom: 0.5rem;
-                background: linear-gradient(90deg, #3b82f6, #8b5cf6);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-            }}
-            
-            .subtitle {{
-                color: var(--text-secondary);
-                font-size: 0.95rem;
-            }}
-            
-            .dashboard-grid {{
-                display: grid;
-                gap: 1.5rem;
-                grid-template-columns: 1fr;
-            }}
-            
-            @media (min-width: 1024px) {{
-                .dashboard-grid {{
-                    grid-template-columns: 380px 1fr;
-                }}
-            }}
-            
-            .card {{
-                background: var(--bg-card);
-                border: 1px solid var(--border);
-                border-radius: 16px;
-                padding: 1.5rem;
-                backdrop-filter: blur(10px);
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            }}
-            
-            .card-title {{
-                font-size: 1.1rem;
-                font-weight: 600;
-                margin-bottom: 1rem;
-                color: var(--text-primary);
-            }}
-            
-            /* Stats Grid */
-            .stats-grid {{
-                display: grid;
-                grid-template-columns: repeat(2, 1fr);
-                gap: 0.75rem;
-                margin-bottom: 1.5rem;
-            }}
-            
-            .stat-card {{
-                background: var(--bg-secondary);
-                border: 1px solid var(--border);
-                border-radius: 12px;
-                padding: 1rem;
-            }}
-            
-            .stat-label {{
-                font-size: 0.75rem;
-                color: var(--text-secondary);
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                margin-bottom: 0.5rem;
-            }}
-            
-            .stat-value {{
-                font-size: 1.75rem;
-                font-weight: 700;
-                color: var(--accent);
-            }}
-            
-            /* Controls */
-            .controls {{
-                display: grid;
-                grid-template-columns: 1fr;
-                gap: 0.75rem;
-                margin-bottom: 1.5rem;
-            }}
-            
-            @media (min-width: 640px) {{
-                .controls {{
-                    grid-template-columns: repeat(2, 1fr);
-                }}
-            }}
-            
-            input, select {{
-                width: 100%;
-                padding: 0.65rem 1rem;
-                background: var(--bg-secondary);
-                border: 1px solid var(--border);
-                border-radius: 8px;
-                color: var(--text-primary);
-                font-size: 0.9rem;
-                transition: all 0.2s;
-            }}
-            
-            input:focus, select:focus {{
-                outline: none;
-                border-color: var(--accent);
-                box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1);
-            }}
-            
-            input::placeholder {{
-                color: var(--text-secondary);
-            }}
-            
-            .button-group {{
-                display: grid;
-                grid-template-columns: repeat(2, 1fr);
-                gap: 0.75rem;
-            }}
-            
-            button {{
-                padding: 0.65rem 1.25rem;
-                border: none;
-                border-radius: 8px;
-                font-size: 0.9rem;
-                font-weight: 600;
-                cursor: pointer;
-                transition: all 0.2s;
-                background: var(--bg-secondary);
-                color: var(--text-primary);
-            }}
-            
-            button:hover {{
-                transform: translateY(-1px);
-            }}
-            
-            button.primary {{
-                background: var(--accent);
-                color: white;
-            }}
-            
-            button.primary:hover {{
-                background: var(--accent-hover);
-            }}
-            
-            button.danger {{
-                background: var(--danger);
-                color: white;
-                padding: 0.5rem 0.75rem;
-                font-size: 0.85rem;
-            }}
-            
-            button.danger:hover {{
-                background: var(--danger-hover);
-            }}
-            
-            /* Table */
-            .table-container {{
-                overflow-x: auto;
-                border-radius: 12px;
-                border: 1px solid var(--border);
-            }}
-            
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-            }}
-            
-            th, td {{
-                padding: 1rem;
-                text-align: left;
-                border-bottom: 1px solid var(--border);
-            }}
-            
-            th {{
-                background: var(--bg-secondary);
-                font-weight: 600;
-                font-size: 0.85rem;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                color: var(--text-secondary);
-            }}
-            
-            tr:last-child td {{
-                border-bottom: none;
-            }}
-            
-            tbody tr:hover {{
-                background: rgba(59, 130, 246, 0.05);
-            }}
-            
-            .badge {{
-                display: inline-block;
-                padding: 0.25rem 0.75rem;
-                border-radius: 999px;
-                font-size: 0.8rem;
-                font-weight: 500;
-                background: var(--bg-secondary);
-                border: 1px solid var(--border);
-            }}
-            
-            .video-link {{
-                display: inline-block;
-                padding: 0.4rem 0.9rem;
-                background: var(--success);
-                color: white;
-                text-decoration: none;
-                border-radius: 6px;
-                font-size: 0.85rem;
-                font-weight: 600;
-                transition: all 0.2s;
-            }}
-            
-            .video-link:hover {{
-                background: var(--success-hover);
-                transform: translateY(-1px);
-            }}
-            
-            .empty-state {{
-                text-align: center;
-                padding: 3rem 1rem;
-                color: var(--text-secondary);
-            }}
-            
-            .chart-container {{
-                margin-top: 1rem;
-                height: 200px;
-            }}
-            
-            footer {{
-                text-align: center;
-                margin-top: 2rem;
-                padding-top: 1rem;
-                border-top: 1px solid var(--border);
-                color: var(--text-secondary);
-                font-size: 0.85rem;
-            }}
-        </style>
-        <script src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
-    </head>
-    <body>
-        <div class="container">
-            <header>
-                <h1>🎭 EmoGo Dashboard</h1>
-                <p class="subtitle">Manage emotion records, analyze patterns, and track mood trends</p>
-            </header>
-
-            <div class="dashboard-grid">
-                <!-- Sidebar: Stats & Controls -->
-                <div>
-                    <div class="card">
-                        <h2 class="card-title">📊 Statistics</h2>
-                        <div class="stats-grid">
-                            <div class="stat-card">
-                                <div class="stat-label">Total Records</div>
-                                <div id="statTotal" class="stat-value">0</div>
-                            </div>
-                            <div class="stat-card">
-                                <div class="stat-label">With Videos</div>
-                                <div id="statWithVid" class="stat-value">0</div>
-                            </div>
-                            <div class="stat-card">
-                                <div class="stat-label">Unique Moods</div>
-                                <div id="statMoods" class="stat-value">0</div>
-                            </div>
-                            <div class="stat-card">
-                                <div class="stat-label">Latest Entry</div>
-                                <div id="statLatest" class="stat-value" style="font-size: 0.9rem;">—</div>
-                            </div>
-                        </div>
-                    </div>
-
-                    <div class="card" style="margin-top: 1.5rem;">
-                        <h2 class="card-title">🔍 Filters</h2>
-                        <div class="controls">
-                            <input id="searchNote" type="text" placeholder="Search notes...">
-                            <select id="moodFilter">
-                                <option value="">All moods</option>
-                            </select>
-                            <input id="dateFrom" type="date" placeholder="From date">
-                            <input id="dateTo" type="date" placeholder="To date">
-                        </div>
-                        <div class="button-group">
-                            <button id="resetBtn">Reset</button>
-                            <button id="refreshBtn" class="primary">Refresh</button>
-                        </div>
-                    </div>
-
-                    <div class="card" style="margin-top: 1.5rem;">
-                        <h2 class="card-title">📈 Mood Distribution</h2>
-                        <div class="chart-container">
-                            <canvas id="moodChart"></canvas>
-                        </div>
-                    </div>
-
-                    <div class="card" style="margin-top: 1.5rem;">
-                        <h2 class="card-title">📅 Timeline</h2>
-                        <div class="chart-container">
-                            <canvas id="timelineChart"></canvas>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Main: Data Table -->
-                <div class="card">
-                    <h2 class="card-title">📋 Records</h2>
-                    <div class="table-container">
-                        <table>
-                            <thead>
-                                <tr>
-                                    <th>Timestamp</th>
-                                    <th>Mood</th>
-                                    <th>Location</th>
-                                    <th>Note</th>
-                                    <th>Video</th>
-                                    <th>Actions</th>
-                                </tr>
-                            </thead>
-                            <tbody id="tableBody">
-                                <tr><td colspan="6" class="empty-state">Loading records...</td></tr>
-                            </tbody>
-                        </table>
-                    </div>
-                </div>
-            </div>
-
-            <footer>
-                Powered by EmoGo Backend v2.0 • Static files: {base_url}/videos
-            </footer>
-        </div>
-
-        <script>
-            const BASE_URL = "{base_url}";
-            let allRecords = [];
-            let filteredRecords = [];
-            let moodChart, timelineChart;
-
-            const elements = {{
-                tableBody: document.getElementById("tableBody"),
-                moodFilter: document.getElementById("moodFilter"),
-                searchNote: document.getElementById("searchNote"),
-                dateFrom: document.getElementById("dateFrom"),
-                dateTo: document.getElementById("dateTo"),
-                resetBtn: document.getElementById("resetBtn"),
-                refreshBtn: document.getElementById("refreshBtn"),
-                statTotal: document.getElementById("statTotal"),
-                statWithVid: document.getElementById("statWithVid"),
-                statMoods: document.getElementById("statMoods"),
-                statLatest: document.getElementById("statLatest"),
-            }};
-
-            // Utility Functions
-            function getVideoUrl(file) {{
-                if (!file) return "";
-                return file.startsWith("http") ? file : `${{BASE_URL}}/videos/${{file}}`;
-            }}
-
-            function parseDate(dateStr) {{
-                const date = new Date(dateStr);
-                return isNaN(date.getTime()) ? null : date;
-            }}
-
-            function formatDate(date) {{
-                if (!date) return "—";
-                return new Intl.DateTimeFormat('en-US', {{
-                    month: 'short',
-                    day: 'numeric',
-                    hour: '2-digit',
-                    minute: '2-digit'
-                }}).format(date);
-            }}
-
-            // Delete Record
-            async function deleteRecord(id) {{
-                if (!confirm("Delete this record permanently?")) return;
-                
-                try {{
-                    const response = await fetch(`${{BASE_URL}}/record/${{id}}`, {{
-                        method: "DELETE"
-                    }});
-                    
-                    if (response.ok) {{
-                        await fetchRecords();
-                    }} else {{
-                        alert("Failed to delete record");
-                    }}
-                }} catch (error) {{
-                    console.error("Delete error:", error);
-                    alert("Error deleting record");
-                }}
-            }}
-
-            // Fetch Records
-            async function fetchRecords() {{
-                try {{
-                    const response = await fetch(`${{BASE_URL}}/records?limit=1000`);
-                    const data = await response.json();
-                    allRecords = data.records || [];
-                    initializeMoodOptions();
-                    applyFilters();
-                }} catch (error) {{
-                    console.error("Fetch error:", error);
-                    elements.tableBody.innerHTML = `
-                        <tr><td colspan="6" class="empty-state">
-                            Failed to load records. Please try again.
-                        </td></tr>
-                    `;
-                }}
-            }}
-
-            // Initialize Mood Filter
-            function initializeMoodOptions() {{
-                const moods = [...new Set(allRecords.map(r => r.mood).filter(Boolean))].sort();
-                elements.moodFilter.innerHTML = 
-                    '<option value="">All moods</option>' +
-                    moods.map(m => `<option value="${{m}}">${{m}}</option>`).join('');
-            }}
-
-            // Apply Filters
-            function applyFilters() {{
-                const searchTerm = elements.searchNote.value.toLowerCase();
-                const selectedMood = elements.moodFilter.value;
-                const fromDate = parseDate(elements.dateFrom.value);
-                const toDate = parseDate(elements.dateTo.value);
-
-                filteredRecords = allRecords.filter(record => {{
-                    const note = (record.note || "").toLowerCase();
-                    const matchesSearch = !searchTerm || note.includes(searchTerm);
-                    const matchesMood = !selectedMood || record.mood === selectedMood;
-                    
-                    const recordDate = parseDate(record.timestamp);
-                    const matchesFrom = !fromDate || (recordDate && recordDate >= fromDate);
-                    const matchesTo = !toDate || (recordDate && recordDate <= toDate);
-
-                    return matchesSearch && matchesMood && matchesFrom && matchesTo;
-                }});
-
-                renderTable();
-                updateStatistics();
-                renderCharts();
-            }}
-
-            // Render Table
-            function renderTable() {{
-                if (filteredRecords.length === 0) {{
-                    elements.tableBody.innerHTML = `
-                        <tr><td colspan="6" class="empty-state">
-                            No records match your filters
-                        </td></tr>
-                    `;
-                    return;
-                }}
-
-                elements.tableBody.innerHTML = filteredRecords.map(record => {{
-                    const videoUrl = getVideoUrl(record.vlog_file);
-                    const location = [record.latitude, record.longitude]
-                        .filter(v => v != null)
-                        .join(", ");
-                    
-                    const videoCell = videoUrl 
-                        ? `<a href="${{videoUrl}}" target="_blank" class="video-link">▶ Watch</a>`
-                        : '<span class="badge">No video</span>';
-
-                    return `
-                        <tr>
-                            <td>${{formatDate(parseDate(record.timestamp))}}</td>
-                            <td><span class="badge">${{record.mood || "—"}}</span></td>
-                            <td>${{location || "—"}}</td>
-                            <td style="max-width: 200px; overflow: hidden; text-overflow: ellipsis;">
-                                ${{record.note || ""}}
-                            </td>
-                            <td>${{videoCell}}</td>
-                            <td>
-                                <button class="danger" onclick="deleteRecord('${{record._id}}')">
-                                    🗑️ Delete
-                                </button>
-                            </td>
-                        </tr>
-                    `;
-                }}).join('');
-            }}
-
-            // Update Statistics
-            function updateStatistics() {{
-                elements.statTotal.textContent = filteredRecords.length;
-                
-                const withVideo = filteredRecords.filter(r => r.vlog_file).length;
-                elements.statWithVid.textContent = withVideo;
-                
-                const uniqueMoods = new Set(filteredRecords.map(r => r.mood).filter(Boolean));
-                elements.statMoods.textContent = uniqueMoods.size;
-                
-                const latestDate = filteredRecords
-                    .map(r => parseDate(r.timestamp))
-                    .filter(Boolean)
-                    .sort((a, b) => b - a)[0];
-                
-                elements.statLatest.textContent = formatDate(latestDate);
-            }}
-
-            // Render Charts
-            function renderCharts() {{
-                // Mood Distribution
-                const moodCounts = filteredRecords.reduce((acc, r) => {{
-                    if (r.mood) acc[r.mood] = (acc[r.mood] || 0) + 1;
-                    return acc;
-                }}, {{}});
-                
-                const moodLabels = Object.keys(moodCounts);
-                const moodData = moodLabels.map(k => moodCounts[k]);
-
-                if (moodChart) moodChart.destroy();
-                moodChart = new Chart(document.getElementById("moodChart"), {{
-                    type: "doughnut",
-                    data: {{
-                        labels: moodLabels,
-                        datasets: [{{
-                            data: moodData,
-                            backgroundColor: [
-                                '#3b82f6', '#8b5cf6', '#ec4899', '#f59e0b', 
-                                '#10b981', '#06b6d4', '#ef4444'
-                            ],
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{
-                            legend: {{
-                                position: 'bottom',
-                                labels: {{ color: '#94a3b8', font: {{ size: 11 }} }}
-                            }}
-                        }}
-                    }}
-                }});
-
-                // Timeline Chart
-                const byDay = filteredRecords.reduce((acc, r) => {{
-                    const date = parseDate(r.timestamp);
-                    if (!date) return acc;
-                    const key = date.toISOString().split('T')[0];
-                    acc[key] = (acc[key] || 0) + 1;
-                    return acc;
-                }}, {{}});
-                
-                const timelineLabels = Object.keys(byDay).sort();
-                const timelineData = timelineLabels.map(k => byDay[k]);
-
-                if (timelineChart) timelineChart.destroy();
-                timelineChart = new Chart(document.getElementById("timelineChart"), {{
-                    type: "line",
-                    data: {{
-                        labels: timelineLabels,
-                        datasets: [{{
-                            label: "Records",
-                            data: timelineData,
-                            borderColor: '#10b981',
-                            backgroundColor: 'rgba(16, 185, 129, 0.1)',
-                            fill: true,
-                            tension: 0.4
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{
-                            legend: {{ display: false }}
-                        }},
-                        scales: {{
-                            x: {{ ticks: {{ color: '#64748b', maxRotation: 45 }} }},
-                            y: {{ 
-                                ticks: {{ color: '#64748b' }}, 
-                                beginAtZero: true 
-                            }}
-                        }}
-                    }}
-                }});
-            }}
-
-            // Event Listeners
-            ["input", "change"].forEach(event => {{
-                elements.searchNote.addEventListener(event, applyFilters);
-                elements.moodFilter.addEventListener(event, applyFilters);
-                elements.dateFrom.addEventListener(event, applyFilters);
-                elements.dateTo.addEventListener(event, applyFilters);
-            }});
-
-            elements.resetBtn.addEventListener("click", () => {{
-                elements.searchNote.value = "";
-                elements.moodFilter.value = "";
-                elements.dateFrom.value = "";
-                elements.dateTo.value = "";
-                applyFilters();
-            }});
-
-            elements.refreshBtn.addEventListener("click", fetchRecords);
-
-            // Initialize
-            fetchRecords();
-        </script>
-    </body>
-    </html>
-    """
+    if request.headers.get("if-none-match") == DASHBOARD_ETAG:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
     
-    return HTMLResponse(content=html_content)
+    if accepts_brotli(request):
+        return HTMLResponse(content=DASHBOARD_BR, headers={**headers, "Content-Encoding": "br"})
+    return HTMLResponse(content=DASHBOARD_HTML, headers=headers)
 
 # ==================== ERROR HANDLERS ====================
 
@@ -914,4 +799,17 @@ async def server_error_handler(request: Request, exc: Exception):
     return JSONResponse(
         status_code=500,
         content={"error": "Internal server error"}
-    )
\ No newline at end of file
+    )
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # libuv event loop and C HTTP parser instead of asyncio's selector loop and h11
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1"))
+    )
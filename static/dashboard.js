@@ -0,0 +1,374 @@
+const BASE_URL = location.origin;
+const PAGE_SIZE = 50;
+let pageRecords = [];
+let page = 0;
+let recordsRequest = 0;
+let moodChart, timelineChart;
+let statsRequest = 0;
+let chartFrame = 0;
+
+const elements = {
+    tableBody: document.getElementById("tableBody"),
+    rowTpl: document.getElementById("rowTpl"),
+    moodFilter: document.getElementById("moodFilter"),
+    searchNote: document.getElementById("searchNote"),
+    dateFrom: document.getElementById("dateFrom"),
+    dateTo: document.getElementById("dateTo"),
+    resetBtn: document.getElementById("resetBtn"),
+    refreshBtn: document.getElementById("refreshBtn"),
+    statTotal: document.getElementById("statTotal"),
+    statWithVid: document.getElementById("statWithVid"),
+    statMoods: document.getElementById("statMoods"),
+    statLatest: document.getElementById("statLatest"),
+    prevBtn: document.getElementById("prevBtn"),
+    nextBtn: document.getElementById("nextBtn"),
+    pageInfo: document.getElementById("pageInfo"),
+};
+
+// Utility Functions
+const HTML_ESCAPES = { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" };
+const HTML_ESCAPE_RE = /[&<>"']/g;
+
+function escapeHtml(value) {
+    return String(value).replace(HTML_ESCAPE_RE, ch => HTML_ESCAPES[ch]);
+}
+
+function debounce(fn, ms) {
+    let timer;
+    return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn(...args), ms);
+    };
+}
+
+function getVideoUrl(file) {
+    if (!file) return "";
+    return file.startsWith("http") ? file : `${BASE_URL}/videos/${file}`;
+}
+
+function parseDate(dateStr) {
+    const date = new Date(dateStr);
+    return isNaN(date.getTime()) ? null : date;
+}
+
+// Built once; constructing a formatter costs far more than formatting
+const DATE_FORMAT = new Intl.DateTimeFormat('en-US', {
+    month: 'short',
+    day: 'numeric',
+    hour: '2-digit',
+    minute: '2-digit'
+});
+
+function formatDate(date) {
+    if (!date) return "—";
+    return DATE_FORMAT.format(date);
+}
+
+// Delete Record
+async function deleteRecord(id) {
+    if (!confirm("Delete this record permanently?")) return;
+
+    try {
+        const response = await fetch(`${BASE_URL}/record/${id}`, {
+            method: "DELETE"
+        });
+
+        if (response.ok) {
+            fetchRecords();
+            fetchStats();
+        } else {
+            alert("Failed to delete record");
+        }
+    } catch (error) {
+        console.error("Delete error:", error);
+        alert("Error deleting record");
+    }
+}
+
+// Fetch one page of records matching the current filters
+async function fetchRecords() {
+    const requestId = ++recordsRequest;
+    const params = filterParams();
+    params.set("skip", page * PAGE_SIZE);
+    // One extra row tells whether a next page exists
+    params.set("limit", PAGE_SIZE + 1);
+    try {
+        const response = await fetch(`${BASE_URL}/records?${params}`);
+        const data = await response.json();
+        // Ignore responses that arrive after a newer filter change
+        if (requestId !== recordsRequest) return;
+        const records = data.records || [];
+        if (records.length === 0 && page > 0) {
+            page--;
+            return fetchRecords();
+        }
+        pageRecords = records.slice(0, PAGE_SIZE);
+        renderTable();
+        elements.prevBtn.disabled = page === 0;
+        elements.nextBtn.disabled = records.length <= PAGE_SIZE;
+        elements.pageInfo.textContent = `Page ${page + 1}`;
+    } catch (error) {
+        console.error("Fetch error:", error);
+        elements.tableBody.innerHTML = `
+            <tr><td colspan="6" class="empty-state">
+                Failed to load records. Please try again.
+            </td></tr>
+        `;
+    }
+}
+
+// Initialize Mood Filter from the unfiltered mood counts
+async function initializeMoodOptions() {
+    try {
+        const response = await fetch(`${BASE_URL}/records/stats`);
+        const stats = await response.json();
+        const moods = Object.keys(stats.mood_counts || {}).sort();
+        const selected = elements.moodFilter.value;
+        elements.moodFilter.innerHTML = 
+            '<option value="">All moods</option>' +
+            moods.map(m => `<option value="${escapeHtml(m)}">${escapeHtml(m)}</option>`).join('');
+        elements.moodFilter.value = selected;
+    } catch (error) {
+        console.error("Mood options error:", error);
+    }
+}
+
+// Apply Filters: restart at the first page and query the server
+function applyFilters() {
+    page = 0;
+    fetchRecords();
+    fetchStats();
+}
+
+function refresh() {
+    initializeMoodOptions();
+    fetchRecords();
+    fetchStats();
+}
+
+// Current filters as query parameters for the API
+function filterParams() {
+    const params = new URLSearchParams();
+    if (elements.searchNote.value) params.set("q", elements.searchNote.value);
+    if (elements.moodFilter.value) params.set("mood", elements.moodFilter.value);
+    if (elements.dateFrom.value) params.set("date_from", elements.dateFrom.value);
+    if (elements.dateTo.value) params.set("date_to", elements.dateTo.value);
+    return params;
+}
+
+// Fetch statistics and chart aggregates computed by MongoDB
+async function fetchStats() {
+    const requestId = ++statsRequest;
+    try {
+        const response = await fetch(`${BASE_URL}/records/stats?${filterParams()}`);
+        const stats = await response.json();
+        // Ignore responses that arrive after a newer filter change
+        if (requestId !== statsRequest) return;
+        renderStats(stats);
+        scheduleCharts(stats);
+    } catch (error) {
+        console.error("Stats error:", error);
+    }
+}
+
+// Render Table
+function renderTable() {
+    if (pageRecords.length === 0) {
+        elements.tableBody.innerHTML = `
+            <tr><td colspan="6" class="empty-state">
+                No records match your filters
+            </td></tr>
+        `;
+        return;
+    }
+
+    const fragment = document.createDocumentFragment();
+    for (const record of pageRecords) {
+        const row = elements.rowTpl.content.firstElementChild.cloneNode(true);
+        const [timeCell, moodCell, locationCell, noteCell, videoCell, actionCell] = row.children;
+        const location = [record.latitude, record.longitude]
+            .filter(v => v != null)
+            .join(", ");
+
+        timeCell.textContent = formatDate(parseDate(record.timestamp));
+        moodCell.firstElementChild.textContent = record.mood || "—";
+        locationCell.textContent = location || "—";
+        noteCell.textContent = record.note || "";
+
+        const videoUrl = getVideoUrl(record.vlog_file);
+        if (videoUrl) {
+            videoCell.querySelector("a").href = videoUrl;
+            videoCell.querySelector(".badge").remove();
+        } else {
+            videoCell.querySelector("a").remove();
+        }
+
+        actionCell.firstElementChild.dataset.id = record._id;
+        fragment.appendChild(row);
+    }
+    elements.tableBody.replaceChildren(fragment);
+}
+
+// Update Statistics
+function renderStats(stats) {
+    elements.statTotal.textContent = stats.total || 0;
+    elements.statWithVid.textContent = stats.with_video || 0;
+    elements.statMoods.textContent = Object.keys(stats.mood_counts || {}).length;
+    elements.statLatest.textContent = formatDate(stats.latest ? parseDate(stats.latest) : null);
+}
+
+// Coalesce chart rebuilds to at most one per animation frame
+function scheduleCharts(stats) {
+    cancelAnimationFrame(chartFrame);
+    chartFrame = requestAnimationFrame(() => renderCharts(stats));
+}
+
+// Min/max decimation: keep each block's lowest and highest point, in
+// order, so peaks survive while the series stays within maxPoints
+function decimate(labels, values, maxPoints) {
+    if (values.length <= maxPoints) return [labels, values];
+    const blockSize = Math.ceil(values.length / Math.floor(maxPoints / 2));
+    const outLabels = [];
+    const outValues = [];
+    for (let start = 0; start < values.length; start += blockSize) {
+        const end = Math.min(start + blockSize, values.length);
+        let min = start;
+        let max = start;
+        for (let i = start + 1; i < end; i++) {
+            if (values[i] < values[min]) min = i;
+            if (values[i] > values[max]) max = i;
+        }
+        for (const i of min === max ? [min] : [Math.min(min, max), Math.max(min, max)]) {
+            outLabels.push(labels[i]);
+            outValues.push(values[i]);
+        }
+    }
+    return [outLabels, outValues];
+}
+
+// Build both charts once; later renders only swap their data
+function createCharts() {
+    moodChart = new Chart(document.getElementById("moodChart"), {
+        type: "doughnut",
+        data: {
+            labels: [],
+            datasets: [{
+                data: [],
+                backgroundColor: [
+                    '#3b82f6', '#8b5cf6', '#ec4899', '#f59e0b', 
+                    '#10b981', '#06b6d4', '#ef4444'
+                ],
+            }]
+        },
+        options: {
+            animation: false,
+            parsing: false,
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    position: 'bottom',
+                    labels: { color: '#94a3b8', font: { size: 11 } }
+                }
+            }
+        }
+    });
+
+    timelineChart = new Chart(document.getElementById("timelineChart"), {
+        type: "line",
+        data: {
+            labels: [],
+            datasets: [{
+                label: "Records",
+                data: [],
+                borderColor: '#10b981',
+                backgroundColor: 'rgba(16, 185, 129, 0.1)',
+                fill: true,
+                tension: 0.4
+            }]
+        },
+        options: {
+            animation: false,
+            // Data arrives as pre-built {x: label index, y} points
+            parsing: false,
+            normalized: true,
+            spanGaps: true,
+            responsive: true,
+            maintainAspectRatio: false,
+            elements: {
+                point: { radius: 0 }
+            },
+            // Points are invisible, so hover by x position rather than hit-testing them
+            interaction: { mode: 'index', intersect: false },
+            plugins: {
+                legend: { display: false }
+            },
+            scales: {
+                x: { ticks: { color: '#64748b', maxRotation: 45 } },
+                y: { 
+                    ticks: { color: '#64748b' }, 
+                    beginAtZero: true 
+                }
+            }
+        }
+    });
+}
+
+// Render Charts
+function renderCharts(stats) {
+    // Mood Distribution
+    const moodCounts = stats.mood_counts || {};
+    const moodLabels = Object.keys(moodCounts);
+    moodChart.data.labels = moodLabels;
+    moodChart.data.datasets[0].data = moodLabels.map(k => moodCounts[k]);
+    moodChart.update('none');
+
+    // Timeline Chart
+    const byDay = stats.by_day || {};
+    const days = Object.keys(byDay);
+    // No more points than the canvas has pixels
+    const [timelineLabels, timelineData] = decimate(
+        days, days.map(k => byDay[k]), Math.max(2, Math.floor(timelineChart.width))
+    );
+    timelineChart.data.labels = timelineLabels;
+    timelineChart.data.datasets[0].data = timelineData.map((y, x) => ({ x, y }));
+    timelineChart.update('none');
+}
+
+// Event Listeners
+// Wait for a pause in typing before querying the server
+elements.searchNote.addEventListener("input", debounce(applyFilters, 250));
+elements.moodFilter.addEventListener("change", applyFilters);
+elements.dateFrom.addEventListener("change", applyFilters);
+elements.dateTo.addEventListener("change", applyFilters);
+
+elements.resetBtn.addEventListener("click", () => {
+    elements.searchNote.value = "";
+    elements.moodFilter.value = "";
+    elements.dateFrom.value = "";
+    elements.dateTo.value = "";
+    applyFilters();
+});
+
+elements.refreshBtn.addEventListener("click", refresh);
+
+// One delegated listener for every row's delete button
+elements.tableBody.addEventListener("click", event => {
+    const button = event.target.closest("button[data-id]");
+    if (button) deleteRecord(button.dataset.id);
+});
+
+elements.prevBtn.addEventListener("click", () => {
+    page--;
+    fetchRecords();
+});
+
+elements.nextBtn.addEventListener("click", () => {
+    page++;
+    fetchRecords();
+});
+
+// Initialize
+document.getElementById("videosUrl").textContent = `${BASE_URL}/videos`;
+createCharts();
+refresh();